@@ -1,17 +1,26 @@
 #imports
-from sys import argv, exit
-from module import Module
+from sys import argv, exit, stdout
+from asyncio import run
+from module import create_modules, create_modules_async
+
+#large batches go through the async driver instead of the capped pool
+ASYNC_THRESHOLD = 32
 
 #main
 def main():
-    print("Start")
+    #one buffered write per phase instead of a lock round-trip per print
+    out = stdout.write
     if len(argv) < 2:
-        print(f"Usage: {argv[0]} <module_names>\nExiting...")
+        out(f"Usage: {argv[0]} <module_names>\nExiting...\n")
         exit(1)
-    print('Creating module(s)...')
-    modules = Module(argv[1:])
-    modules.create_modules()
-    print('Finished')  
+    out('Start\nCreating module(s)...\n')
+    modules = argv[1:]
+    if len(modules) > ASYNC_THRESHOLD:
+        run(create_modules_async(modules))
+    else:
+        create_modules(modules)
+    out('Finished\n')
+    stdout.flush()
 
 #driver
 if __name__ == '__main__':
@@ -1,6 +1,5 @@
 """
 @brief generates directories and files for a new module.
-@class Module
 @param module_names: the names of the modules to be created.
 @returns None
 
@@ -17,159 +16,314 @@ creates a new module with the given name and the following directory structure:
     scripts -> js | py
     tools -> build | deploy
     files -> README.md | CONTRIBUTING.md | LICENSE | package.json | .gitignore
+
+the module is a flat set of functions over a constant schema; the former
+Module class carried no state beyond the schema, so module-level functions
+avoid per-call attribute resolution in the hot loops.
 """
 #imports
-from os import path, makedirs
+from os import makedirs, mkdir, listdir, scandir, writev, close, O_WRONLY, O_CREAT, O_TRUNC, O_APPEND
+from os import open as open_fd
+from os.path import dirname
+from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from asyncio import gather, to_thread, get_running_loop
+import atexit
+import uring
 
-#class
-class Module:
-    """
-    Module class
-    @brief generates directories and files for a new module.
-    @param module_names: the name of the module to be created.
-
-    @methods
-    create_module(self, module_name:str) -> bool
-    create_subdirectory(self, module_name:str, subdirectory:str) -> bool
-    create_files(self) -> bool
-    create_modules(self) -> None
-    
-    @details 
-    creates a new module with the given name and the following directory structure:
-        module_name -> data | docs | assets | src | tests | scripts | tools | files
-        data -> raw | processed | output
-        docs -> api | design | notes | reports
-        assets -> images | text
-        src -> components | models | utils | include
-        tests -> unit | integration | e2e
-        scripts -> js | py
-        tools -> build | deploy
-        files -> README.md | CONTRIBUTING.md | LICENSE | package.json | .gitignore
-    """
-    def __init__(self, module_names:list[str]) -> None:
-        self.dir_structure:dict = {
-            "module_names": tuple(module_names),
-            "directories": {
-                "data": ("raw", "processed", "output"),
-                "docs": ("api", "design", "notes", "reports"),
-                "assets": ("images", "text"),
-                "src": ("components", "models", "utils", "include"),
-                "tests": ("unit", "integration", "e2e"),
-                "scripts": ("js", "py"),
-                "tools": ("build", "deploy")
-            },
-            "files": ("README.md", "CONTRIBUTING.md", "LICENSE", "package.json", ".gitignore")
-        }
-    def create_module(self, module_name:str) -> bool:
-        """
-        @brief creates a new module
-        @param module_name: name of the module to create
-        @returns bool: if module is created then true, else false
-
-        @note
-        Time: O(1)
-        Space: O(1)
-
-        @details
-        takes module_name and creates an empty directory
-        """
-        #check if module exists in path
-        if not path.exists(module_name):
-            makedirs(module_name, exist_ok=True)
-            return True
+#directory schema; immutable tuples fixed at import time, indexed access
+#instead of string hashing on every lookup
+_DIRS:tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("data", ("raw", "processed", "output")),
+    ("docs", ("api", "design", "notes", "reports")),
+    ("assets", ("images", "text")),
+    ("src", ("components", "models", "utils", "include")),
+    ("tests", ("unit", "integration", "e2e")),
+    ("scripts", ("js", "py")),
+    ("tools", ("build", "deploy"))
+)
+_FILES:tuple[str, ...] = ("README.md", "CONTRIBUTING.md", "LICENSE", "package.json", ".gitignore")
+#flat leaf paths, built once; parents are created explicitly, parents-first
+_LEAF_PATHS:tuple[str, ...] = tuple(
+    f'{directory}/{sub_directory}'
+    for directory, sub_directories in _DIRS
+    for sub_directory in sub_directories
+)
+
+#specialized builders; the schema is fixed at import time, so the per-module
+#loops are partially evaluated into straight-line functions with literal
+#paths and callees bound as default-argument locals (no global lookups)
+def _generate_builders() -> str:
+    """
+    @brief generates the source of the unrolled builder functions
+    @returns str: python source for _build_dirs and _build_files
+
+    @details
+    unrolls the directory creation and the empty-file touches into
+    straight-line bodies; regenerated automatically if the schema changes.
+    the hierarchy is known statically, so raw mkdir calls run parents-first
+    (root, then first-level dirs, then leaves) with no per-component stats;
+    makedirs would stat every component of every path to find what to create
+    """
+    lines = ['def _build_dirs(name:str, mkdir=mkdir) -> None:',
+             "    root = name + '/'"]
+    ordered = (name for level in (('',), tuple(directory for directory, _ in _DIRS), _LEAF_PATHS) for name in level)
+    for relative in ordered:
+        target = 'name' if relative == '' else f"root + '{relative}'"
+        lines += ['    try:',
+                  f'        mkdir({target})',
+                  '    except FileExistsError:',
+                  '        pass']
+    lines += ['', 'def _build_files(name:str, Path=Path) -> None:',
+              "    root = name + '/'"]
+    for file in _FILES[1:]:
+        lines.append(f"    Path(root + '{file}').touch(exist_ok=True)")
+    return '\n'.join(lines)
+
+exec(_generate_builders())
+
+#README header segments; only the module name and timestamp vary per run,
+#so the constant bytes are built once and vectored around them at write time
+_README_PREFIX:bytes = b'# '
+_README_MIDDLE:bytes = b'\nCreated -> '
+_README_SUFFIX:bytes = b'\nAuthor -> \n\n## Description\n\n'
+
+#log sink; opened lazily on first use, one persistent append fd
+_LOG_LOCK:Lock = Lock()
+_log_fd:int|None = None
+
+#functions
+def create_module(module_name:str, existing:set[str]|None=None) -> bool:
+    """
+    @brief creates a new module
+    @param module_name: name of the module to create
+    @param existing: names already present in the working directory; listed
+        once by the caller so membership replaces a stat per name
+    @returns bool: if module is created then true, else false
+
+    @note
+    Time: O(1)
+    Space: O(1)
+
+    @details
+    takes module_name and creates an empty directory.
+    one mkdir syscall for the leaf; an existing module surfaces as
+    FileExistsError, or as a set hit when the caller supplies the
+    directory listing. nested names get their intermediates via makedirs
+    """
+    #answer from the cached listing when there is one; no syscall at all
+    if existing is not None and module_name in existing:
+        return False
+    #nested names need their intermediates; the leaf keeps its bare mkdir
+    parent = dirname(module_name)
+    if parent:
+        makedirs(parent, exist_ok=True)
+    #create the directory; existence is reported by the kernel, not a stat
+    try:
+        mkdir(module_name)
+    except FileExistsError:
         return False
+    if existing is not None:
+        existing.add(module_name)
+    return True
 
-    def create_directory(self, module_name:str, directory:str) -> bool:
-        """
-        @brief creates a new directory
-        @param module_name: name of the module to create
-        @param directory: name of the directory to create
-        @returns bool: if directory is created then true, else false
-
-        @note
-        Time: O(1)
-        Space: O(1)
-
-        @details
-        takes module_name and directory, creates an empty directory
-        """
-        #check if module exists and subdirectory does not exist
-        if path.exists(module_name) and not path.exists(f'{module_name}/{directory}'):
-            makedirs(f'{module_name}/{directory}', exist_ok=True)
-            return True
+def create_directory(module_name:str, directory:str) -> bool:
+    """
+    @brief creates a new directory
+    @param module_name: name of the module to create
+    @param directory: name of the directory to create
+    @returns bool: if directory is created then true, else false
+
+    @note
+    Time: O(1)
+    Space: O(1)
+
+    @details
+    takes module_name and directory, creates an empty directory.
+    one scandir pass answers both "module exists" and "directory already
+    there" from the readdir entries, with no stat per child
+    """
+    #one readdir pass covers both existence questions
+    try:
+        entries = {entry.name for entry in scandir(module_name)}
+    except FileNotFoundError:
+        return False
+    if directory in entries:
         return False
-    
-    def create_subdirectories(self, module_name:str) -> bool:
-        """
-        @brief creates subdirectories
-        @param module_name: name of the module to create
-        @returns bool: if subdirectories are created then true, else false
-
-        @note
-        Time: O(n^2)
-        Space: O(n)
-
-        @details
-        takes module_name, and creates subdirectories in the module
-        """
-        #create defined directories
-        for directory in self.dir_structure.get('directories'):
-            makedirs(f'{module_name}/{directory}', exist_ok=True)
-            #create sub directories 
-            for sub_directory in self.dir_structure.get('directories').get(directory):
-                makedirs(f'{module_name}/{directory}/{sub_directory}', exist_ok=True)
+    #the directory may appear between the listing and here; same handling
+    #as create_module for the race
+    try:
+        mkdir(f'{module_name}/{directory}')
         return True
+    except FileExistsError:
+        return False
 
-    def create_files(self, module_name) -> bool:
-        """
-        @brief creates files
-        @returns bool: if files are created then true, else false
-
-        @note
-        Time: O(n)
-        Space: O(n)
-
-        @details
-        creates files in the current directory
-        """
-        #no files defined
-        if len(self.dir_structure.get('files')) == 0:
-            return False
-        
-        #create files
-        for file in self.dir_structure.get('files'):
-            #file will close after writing
-            with open(f'{module_name}/{file}', 'w') as f:
-                if file == self.dir_structure.get('files')[0]:
-                    f.write(f'# {module_name.capitalize()}\nCreated -> {datetime.now()}\nAuthor -> \n\n## Description\n\n')
-                else:
-                    f.write('')
-        return True
-    
-    def create_modules(self) -> None:
-        """
-        @brief creates modules from given modules
-        @returns None
-
-        @details
-        takes module_names, and creates modules from the given names.
-        outputs success or failure of module creation.
-        """
-        for module in self.dir_structure.get('module_names'):
-            self.log(module, f"Creating module {module} has {'succeeded' if self.create_module(module) else 'failed'}")
-            self.log(module, f"Creating subdirectories for {module} has {'succeeded' if self.create_subdirectories(module) else 'failed'}")
-            self.log(module, f"Creating files for {module} has {'succeeded' if self.create_files(module) else 'failed'}")
-
-    def log(self, module_name:str, message:str) -> None:
-        """
-        @brief logs a message
-        @param message: the message to log
-        @returns None
-
-        @details
-        logs the message to the console
-        """
-        if path.exists(module_name):
-            with open(f'{module_name}/module.log', 'a') as f:
-                f.write(f'{datetime.now()}\t{message}\n')
\ No newline at end of file
+def create_subdirectories(module_name:str) -> bool:
+    """
+    @brief creates subdirectories
+    @param module_name: name of the module to create
+    @returns bool: if subdirectories are created then true, else false
+
+    @note
+    Time: O(n)
+    Space: O(1)
+
+    @details
+    takes module_name, and creates subdirectories in the module.
+    parents are created before their children in every backend.
+    on Linux with liburing installed, each tree level is submitted as one
+    io_uring batch (parents before children); otherwise the generated
+    straight-line builder runs with the paths already inlined
+    """
+    #batched path: one ring submission per level, parents first
+    if uring.available(len(_LEAF_PATHS)):
+        root = module_name + '/'
+        parents = tuple(root + directory for directory, _ in _DIRS)
+        leaves = tuple(root + leaf for leaf in _LEAF_PATHS)
+        if uring.batch_mkdir(parents) and uring.batch_mkdir(leaves):
+            return True
+    #unrolled builder; no loop, no schema iteration, literal paths
+    _build_dirs(module_name)
+    return True
+
+def create_files(module_name:str, now:bytes|None=None) -> bool:
+    """
+    @brief creates files
+    @param module_name: name of the module to create
+    @param now: creation timestamp as bytes; taken once per run by the caller
+    @returns bool: if files are created then true, else false
+
+    @note
+    Time: O(n)
+    Space: O(n)
+
+    @details
+    creates files in the module directory.
+    the README header is the constant segments vectored around the module
+    name and shared timestamp, so per-module work is a name encode and one
+    writev rather than a datetime call and f-string formatting
+    """
+    #no files defined
+    if len(_FILES) == 0:
+        return False
+
+    #prepend the module root once; plain concat beats an f-string per file
+    root = module_name + '/'
+
+    #only the name and timestamp vary; the rest of the header is constant
+    if now is None:
+        now = str(datetime.now()).encode()
+    header_file = _FILES[0]
+    name = module_name.capitalize().encode()
+
+    #batched path: the empty files go out as one ring of open+close chains
+    if uring.available(len(_FILES) - 1):
+        empty_paths = tuple(root + file for file in _FILES if file is not header_file)
+        if not uring.batch_touch(empty_paths):
+            _build_files(module_name)
+    else:
+        #unrolled builder; touch calls with literal paths, no loop
+        _build_files(module_name)
+
+    #the README keeps its custom payload: one raw fd, one vectored write
+    fd = open_fd(root + header_file, O_WRONLY | O_CREAT | O_TRUNC, 0o644)
+    writev(fd, [_README_PREFIX, name, _README_MIDDLE, now, _README_SUFFIX])
+    close(fd)
+    return True
+
+def create_modules(module_names:list[str]) -> None:
+    """
+    @brief creates modules from given names
+    @param module_names: the names of the modules to create
+    @returns None
+
+    @details
+    takes module_names, and creates modules from the given names.
+    outputs success or failure of module creation.
+    modules are independent, so each one runs as a thread pool task and
+    its blocking mkdir/open syscalls overlap with the other modules'.
+    log messages stay ordered within a module
+    """
+    if not module_names:
+        return
+    #one timestamp for the whole run; saves a datetime call per module
+    now = str(datetime.now()).encode()
+    #list the working directory once; membership answers every existence query
+    existing = set(listdir('.'))
+    with ThreadPoolExecutor(max_workers=min(32, len(module_names))) as pool:
+        futures = [pool.submit(_create_one, module, now, existing) for module in module_names]
+        #surface worker failures; result() re-raises, matching the async driver
+        for future in futures:
+            future.result()
+
+async def create_modules_async(module_names:list[str]) -> None:
+    """
+    @brief creates modules from given names on the event loop
+    @param module_names: the names of the modules to create
+    @returns None
+
+    @details
+    async variant of create_modules for large batches: every module is a
+    to_thread task gathered at once. to_thread runs on the loop's default
+    executor, whose stock cap (min(32, cpu_count()+4)) would allow fewer
+    in-flight syscall streams than the explicit pool, so a wider executor
+    sized to the batch is installed first; asyncio.run shuts it down with
+    the loop. drive it with asyncio.run(create_modules_async(names))
+    """
+    if not module_names:
+        return
+    #widen the default executor so the batch really overlaps; the stock
+    #cap would leave most of a large batch queued behind ~32 workers
+    get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=min(128, len(module_names))))
+    #one timestamp for the whole run; saves a datetime call per module
+    now = str(datetime.now()).encode()
+    #list the working directory once; membership answers every existence query
+    existing = set(listdir('.'))
+    await gather(*(to_thread(_create_one, module, now, existing) for module in module_names))
+
+def _create_one(module:str, now:bytes|None=None, existing:set[str]|None=None) -> None:
+    """
+    @brief creates a single module and logs each step
+    @param module: name of the module to create
+    @param now: creation timestamp as bytes, shared across the run
+    @param existing: cached working-directory listing, shared across the run
+    @returns None
+
+    @details
+    accumulates the three status messages and writes them as one record
+    """
+    messages = [
+        f"Creating module {module} has {'succeeded' if create_module(module, existing) else 'failed'}",
+        f"Creating subdirectories for {module} has {'succeeded' if create_subdirectories(module) else 'failed'}",
+        f"Creating files for {module} has {'succeeded' if create_files(module, now) else 'failed'}"
+    ]
+    log(messages)
+
+def log(messages:list[str]) -> None:
+    """
+    @brief logs messages as a single record
+    @param messages: the messages to log
+    @returns None
+
+    @details
+    timestamps each message and emits the lines as one vectored writev,
+    so a module costs one syscall instead of an open/write/close per line
+    """
+    global _log_fd
+    lines = [f'{datetime.now()}\t{message}\n'.encode() for message in messages]
+    with _LOG_LOCK:
+        if _log_fd is None:
+            #one persistent append fd instead of open/append/close per message
+            _log_fd = open_fd('log.txt', O_WRONLY | O_CREAT | O_APPEND, 0o644)
+            atexit.register(_close_log)
+        writev(_log_fd, lines)
+
+def _close_log() -> None:
+    """
+    @brief closes the log fd at interpreter exit
+    @returns None
+    """
+    if _log_fd is not None:
+        close(_log_fd)
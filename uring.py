@@ -0,0 +1,142 @@
+"""
+@brief optional io_uring backend for batched directory and file creation.
+
+@details
+wraps the liburing python binding when it is installed on Linux.
+a batch of independent mkdir calls is submitted as one ring of
+IORING_OP_MKDIRAT entries, and a batch of empty-file creates as linked
+OPENAT+CLOSE chains, each reaped with a single io_uring_enter, turning
+N user/kernel transitions into one. callers fall back to os-level
+syscalls when the binding is missing, the batch is too small to be
+worth a ring submission, or ring setup fails.
+"""
+#imports
+from os import O_WRONLY, O_CREAT
+from errno import EEXIST
+from threading import local
+import atexit
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+#rings are not worth it for tiny batches; stay on plain syscalls below this
+MIN_BATCH:int = 4
+#one persistent ring per thread; setup (mmaps) is paid once, not per batch
+_RING_ENTRIES:int = 64
+_FILE_SLOTS:int = 16
+_local = local()
+
+#functions
+def available(batch_size:int) -> bool:
+    """
+    @brief reports whether the io_uring backend should be used
+    @param batch_size: number of operations in the intended batch
+    @returns bool: if the backend is usable and the batch is large enough then true, else false
+    """
+    return liburing is not None and batch_size >= MIN_BATCH
+
+def _get_ring():
+    """
+    @brief returns this thread's persistent ring, initializing it lazily
+    @returns the thread-local ring, or None if ring setup failed
+
+    @details
+    queue_init costs a syscall plus mmaps and queue_exit the munmaps;
+    paid per batch that overhead would swallow the round-trips the batch
+    saves, so each worker thread keeps one ring for its whole lifetime.
+    the sparse fixed-file table for batch_touch is registered once here;
+    teardown is deferred to interpreter exit
+    """
+    ring = getattr(_local, 'ring', None)
+    if ring is None and not getattr(_local, 'ring_failed', False):
+        try:
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(_RING_ENTRIES, ring)
+            #sparse fixed-file table so batched opens land in known slots
+            liburing.io_uring_register_files_sparse(ring, _FILE_SLOTS)
+            _local.ring = ring
+            atexit.register(liburing.io_uring_queue_exit, ring)
+        except OSError:
+            #remember the failure; do not retry setup on every batch
+            _local.ring_failed = True
+            ring = None
+    return ring
+
+def _reap(ring, count:int) -> bool:
+    """
+    @brief walks a batch's completions and checks every result
+    @param ring: the ring the batch was submitted on
+    @param count: number of completions to reap
+    @returns bool: if every operation succeeded (or hit EEXIST) then true, else false
+
+    @details
+    already-existing targets (-EEXIST completions) are not failures;
+    any other negative result fails the batch so callers fall back to
+    the serial path instead of leaving a half-built tree
+    """
+    ok = True
+    cqe = liburing.io_uring_cqe()
+    for _ in range(count):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        if cqe.res < 0 and cqe.res != -EEXIST:
+            ok = False
+        liburing.io_uring_cqe_seen(ring, cqe)
+    return ok
+
+def batch_mkdir(paths:tuple) -> bool:
+    """
+    @brief creates a batch of directories with one ring submission
+    @param paths: directory paths to create; must not depend on each other
+    @returns bool: if the batch was submitted and reaped then true, else false
+
+    @details
+    paths within one batch must be independent (same tree level);
+    callers submit parents-first, one level per batch.
+    already-existing directories (EEXIST completions) are not failures.
+    """
+    if not available(len(paths)) or len(paths) > _RING_ENTRIES:
+        return False
+    ring = _get_ring()
+    if ring is None:
+        return False
+    try:
+        for p in paths:
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_mkdirat(sqe, p.encode(), 0o777)
+        liburing.io_uring_submit_and_wait(ring, len(paths))
+        return _reap(ring, len(paths))
+    except OSError:
+        return False
+
+def batch_touch(paths:tuple) -> bool:
+    """
+    @brief creates a batch of empty files with one ring submission
+    @param paths: file paths to create; existing contents are preserved
+    @returns bool: if the batch was submitted and reaped then true, else false
+
+    @details
+    each file is an OPENAT entry opening into a fixed-file slot, linked
+    to a CLOSE of the same slot so the pair forms an ordered chain; the
+    whole batch is one submission of 2*len(paths) entries
+    """
+    if not available(len(paths)) or 2 * len(paths) > _RING_ENTRIES or len(paths) > _FILE_SLOTS:
+        return False
+    ring = _get_ring()
+    if ring is None:
+        return False
+    #no O_TRUNC: touch semantics, matching the Path.touch fallback
+    flags = O_WRONLY | O_CREAT
+    try:
+        for index, p in enumerate(paths):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_openat_direct(sqe, p.encode(), flags, 0o644, index)
+            #link the close to its open so the pair executes in order
+            sqe.flags |= liburing.IOSQE_IO_LINK
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_close_direct(sqe, index)
+        liburing.io_uring_submit_and_wait(ring, 2 * len(paths))
+        return _reap(ring, 2 * len(paths))
+    except OSError:
+        return False